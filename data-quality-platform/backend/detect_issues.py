@@ -6,46 +6,177 @@ Uses pandas, numpy for thorough rule-based detection
 import pandas as pd
 import numpy as np
 import json
+import os
 import sys
 import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Union
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import orjson  # C serializer, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+# Precompiled patterns (compiled once at import instead of per-row/per-column)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_SEP_RE = re.compile(r'[-\s()\.]')
+_PHONE_RE = re.compile(r'^\+?\d{10,15}$')
+# All three date layouts classified in one scan via named alternatives
+_DATE_FMT_RE = re.compile(
+    r'^(?:(?P<ISO>\d{4}-\d{2}-\d{2})|(?P<US>\d{2}/\d{2}/\d{4})|(?P<EU>\d{2}-\d{2}-\d{4}))'
+)
+
+# Placeholder tokens matched exactly (case-insensitive) plus the two
+# prefix families; a set lookup + startswith beats a 16-way regex alternation
+_EXACT_PLACEHOLDERS = frozenset((
+    'null', 'n/a', 'na', 'none', 'unknown', 'tbd', 'todo', 'xxx',
+    '###', '---', 'placeholder', 'temp', 'test', 'dummy'
+))
+_PLACEHOLDER_PREFIXES = ('BAD_', 'INVALID')
+
+# Cap per-issue affectedRows payload; totalAffectedRows keeps the true count
+MAX_AFFECTED_ROWS = 1000
 
 class DataQualityDetector:
-    def __init__(self, data: List[Dict], table_name: str):
-        """Initialize detector with data"""
-        self.df = pd.DataFrame(data)
+    def __init__(self, data: Union[List[Dict], pd.DataFrame, 'pa.Table'], table_name: str,
+                 stream: bool = False):
+        """
+        Initialize detector with data (records, DataFrame, or Arrow Table).
+        With stream=True issues are written to stdout as JSON lines the
+        moment they are found instead of accumulating in memory.
+        """
+        if isinstance(data, pd.DataFrame):
+            # Already columnar: use as-is, no row-wise transpose
+            self.df = data
+        elif pa is not None and isinstance(data, pa.Table):
+            self.df = data.to_pandas()
+        else:
+            # from_records is the faster row-oriented constructor path
+            self.df = pd.DataFrame.from_records(data)
+        # Promote cleanly-typed object columns to real numeric blocks so the
+        # vectorized kernels (and the numeric-dtype short-circuits) kick in
+        self.df = self.df.infer_objects()
         self.table_name = table_name
+        self.stream = stream
         self.issues = []
+        self._issue_count = 0
         self.total_rows = len(self.df)
         self.total_cols = len(self.df.columns)
+        # Shared per-column coercions (astype(str), to_numeric, ...) computed
+        # once and reused across detectors; a racing thread at worst
+        # recomputes a value, it never corrupts the dict
+        self._col_cache: Dict[Any, Dict[str, Any]] = {}
+
+        # Name-based column groupings, computed once so detectors do a set
+        # lookup instead of re-lowercasing and substring-scanning every
+        # column name on every call
+        self._lower_cols = {c: str(c).lower() for c in self.df.columns}
+        lc = self._lower_cols
+        self._email_cols = {c for c, l in lc.items() if 'email' in l}
+        self._phone_cols = {c for c, l in lc.items() if 'phone' in l}
+        self._date_cols = {c for c, l in lc.items() if 'date' in l or 'time' in l}
+        negative_keywords = ['price', 'amount', 'quantity', 'count', 'total',
+                             'qty', 'cost', 'balance', 'age']
+        self._negative_cols = {c for c, l in lc.items()
+                               if any(k in l for k in negative_keywords)}
+        self._id_like_cols = [c for c, l in lc.items()
+                              if 'id' in l or 'code' in l or 'sku' in l]
+        # One regex scan per name instead of seven substring tests
+        self._numeric_name_re = re.compile(r'(?:id|count|number|qty|quantity|amount|price)', re.I)
+        self._numeric_name_cols = {c for c in lc
+                                   if self._numeric_name_re.search(str(c))}
+        self._fk_cols = {c: [(p, t) for p, t in self.FK_PATTERNS.items() if p in l]
+                         for c, l in lc.items()
+                         if any(p in l for p in self.FK_PATTERNS)}
+
+        # Low-cardinality string columns (status, category, country codes...)
+        # become categoricals so string scans run over the small categories
+        # array instead of every row. Object and string dtypes are checked
+        # explicitly (select_dtypes(['object']) only matches str columns
+        # through a deprecated pandas 3 compat shim).
+        for c in self._object_or_string_cols():
+            s = self.df[c]
+            try:
+                if s.nunique(dropna=False) / max(len(s), 1) < 0.5:
+                    self.df[c] = s.astype('category')
+            except TypeError:  # unhashable values (nested lists/dicts)
+                pass
+
+        # High-cardinality string columns get the Arrow-backed string dtype
+        # when pyarrow is available: contiguous UTF-8 buffers instead of one
+        # Python str object per cell, so .str kernels run leaner
+        if pa is not None:
+            for c in self._object_or_string_cols():
+                try:
+                    self.df[c] = self.df[c].astype('string[pyarrow]')
+                except Exception:
+                    pass  # mixed non-string values stay object
         
     def detect_all_issues(self):
-        """Run all detection methods"""
+        """
+        Run all detection methods. Returns the collected issue list, or the
+        number of issues emitted when streaming (they are already on stdout).
+        """
         print(f"🔍 Scanning {self.table_name}: {self.total_rows} rows × {self.total_cols} columns", file=sys.stderr)
         
-        # Run all detection methods
-        self.detect_missing_values()
-        self.detect_null_placeholders()
-        self.detect_duplicates()
-        self.detect_invalid_emails()
-        self.detect_invalid_phones()
-        self.detect_invalid_dates()
-        self.detect_negative_values()
-        self.detect_outliers()
-        self.detect_whitespace_issues()
-        self.detect_format_inconsistencies()
-        self.detect_referential_integrity()
-        self.detect_data_type_mismatches()
-        
-        print(f"✅ Detected {len(self.issues)} issues with exact locations", file=sys.stderr)
+        # Per-column detectors fan out across a thread pool: the heavy
+        # lifting happens inside GIL-releasing pandas/NumPy kernels, so wide
+        # tables scale across cores. Cross-column checks stay sequential.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            self._run_per_column(self._missing_values_for_col, executor)
+            self._run_per_column(self._null_placeholders_for_col, executor)
+            self.detect_duplicates()
+            self._run_per_column(self._invalid_emails_for_col, executor)
+            self._run_per_column(self._invalid_phones_for_col, executor)
+            self._run_per_column(self._invalid_dates_for_col, executor)
+            self._run_per_column(self._negative_values_for_col, executor)
+            self._run_per_column(self._outliers_for_col, executor)
+            self._run_per_column(self._whitespace_issues_for_col, executor)
+            self._run_per_column(self._format_inconsistencies_for_col, executor)
+            self._run_per_column(self._referential_integrity_for_col, executor)
+            self._run_per_column(self._data_type_mismatches_for_col, executor)
+
+        print(f"✅ Detected {self._issue_count} issues with exact locations", file=sys.stderr)
+        if self.stream:
+            return self._issue_count
         return self.issues
-    
+
     def add_issue(self, issue: Dict):
-        """Add an issue with validation"""
-        if issue:
+        """
+        Add an issue with validation. In streaming mode the issue is
+        emitted to stdout as one JSON line and never kept in memory, so
+        huge scans stay flat on RSS; otherwise it accumulates in
+        self.issues for the single-document response.
+        """
+        if not issue:
+            return
+        self._issue_count += 1
+        if self.stream:
+            sys.stdout.write(json.dumps(issue, default=str) + '\n')
+        else:
             self.issues.append(issue)
+
+    def _run_per_column(self, detector, executor=None):
+        """
+        Apply a per-column detector to every column, optionally across a
+        thread pool. executor.map preserves column order, so the issue list
+        comes out identical to the sequential path; issues are appended on
+        the calling thread only.
+        """
+        mapper = executor.map if executor is not None else map
+        for col_issues in mapper(detector, self.df.columns):
+            for issue in col_issues:
+                self.add_issue(issue)
     
+    # Pandas 0-based position -> 1-based data row number shown by the
+    # frontend table (header not counted)
+    _row_offset = 1
+
     def adjust_row_number(self, pandas_index: int) -> int:
         """
         Convert pandas 0-based index to data row number (1-based, not counting header)
@@ -53,120 +184,220 @@ class DataQualityDetector:
         Pandas index 0 = Row 1 (first data row)
         Pandas index 155 = Row 156 (156th data row)
         """
-        return pandas_index + 1  # +1 for 1-based indexing (header not counted)
-    
+        return pandas_index + self._row_offset
+
+    def _mask_to_pos(self, mask) -> np.ndarray:
+        """
+        Positional indices of a boolean mask in one flatnonzero pass — no
+        DataFrame slice, Index object, or Python int list in between.
+        """
+        if isinstance(mask, pd.Series):
+            mask = mask.to_numpy(dtype=bool, na_value=False)
+        return np.flatnonzero(mask)
+
+    def _affected_rows(self, indices) -> List[int]:
+        """Adjust row numbers in one vectorized add, capped at MAX_AFFECTED_ROWS"""
+        arr = np.asarray(indices[:MAX_AFFECTED_ROWS], dtype=np.int64)
+        return (arr + self._row_offset).tolist()
+
+    def _str(self, col) -> pd.Series:
+        """Memoized astype(str) view of a column"""
+        d = self._col_cache.setdefault(col, {})
+        if 'str' not in d:
+            d['str'] = self.df[col].astype(str)
+        return d['str']
+
+    def _str_stripped_lower(self, col) -> pd.Series:
+        """Memoized stripped+lowercased string view of a column"""
+        d = self._col_cache.setdefault(col, {})
+        if 'str_stripped_lower' not in d:
+            d['str_stripped_lower'] = self._str(col).str.strip().str.lower()
+        return d['str_stripped_lower']
+
+    def _numeric(self, col) -> pd.Series:
+        """Memoized to_numeric(errors='coerce') view of a column"""
+        d = self._col_cache.setdefault(col, {})
+        if 'numeric' not in d:
+            d['numeric'] = pd.to_numeric(self.df[col], errors='coerce')
+        return d['numeric']
+
+    def _object_or_string_cols(self) -> List:
+        """Columns with object dtype or a string dtype (str/string[...])"""
+        return [c for c, dtype in self.df.dtypes.items()
+                if dtype == object or isinstance(dtype, pd.StringDtype)]
+
+    def _is_text_col(self, col) -> bool:
+        """String columns: object dtype, or its categorical/string-dtype form"""
+        dtype = self.df[col].dtype
+        return dtype == 'object' or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+
+    def _category_row_mask(self, s, cat_mask) -> np.ndarray:
+        """Broadcast a boolean mask over a categorical's categories back to rows"""
+        codes = s.cat.codes.to_numpy()
+        out = np.zeros(len(codes), dtype=bool)
+        valid = codes >= 0  # -1 codes are NaN
+        out[valid] = np.asarray(cat_mask)[codes[valid]]
+        return out
+
+    def _build_locations(self, col, indices, limit: int = 20) -> List[Dict]:
+        """
+        Build exactLocations entries from positional indices.
+        Slices the column's ndarray once instead of doing a .loc label
+        lookup per cell.
+        """
+        pos = np.asarray(indices[:limit], dtype=np.int64)
+        values = self.df[col].to_numpy()[pos]
+        rows = (pos + self._row_offset).tolist()
+        return [
+            {'row': r, 'column': col, 'value': str(v)}
+            for r, v in zip(rows, values)
+        ]
+
+    def _location_fields(self, col, indices) -> Dict[str, Any]:
+        """
+        The four row-location fields shared by most issues, built from one
+        adjusted position array: affectedRows and exactLocations both reuse
+        the same offset add and ndarray value slice instead of walking the
+        indices separately.
+        """
+        pos = np.asarray(indices, dtype=np.int64)
+        adj = pos[:MAX_AFFECTED_ROWS] + self._row_offset
+        values = self.df[col].to_numpy()[pos[:20]]
+        return {
+            'affectedRows': adj.tolist(),
+            'affectedRowsTruncated': len(pos) > MAX_AFFECTED_ROWS,
+            'totalAffectedRows': len(pos),
+            'exactLocations': [
+                {'row': int(r), 'column': col, 'value': str(v)}
+                for r, v in zip(adj[:20], values)
+            ],
+        }
+
+    def _example_values(self, col, indices, limit: int = 5) -> List[str]:
+        """Example bad values from one ndarray slice, no per-cell .loc lookups"""
+        pos = np.asarray(indices[:limit], dtype=np.int64)
+        return [str(v) for v in self.df[col].to_numpy()[pos]]
+
     def detect_missing_values(self):
         """Detect missing/null/empty values with exact locations"""
-        for col in self.df.columns:
-            # Check for: NaN, None, empty string, whitespace-only strings, and string 'nan'
-            missing_mask = (
-                self.df[col].isna() | 
-                (self.df[col] == '') | 
-                (self.df[col].astype(str).str.strip() == '') |
-                (self.df[col].astype(str).str.lower() == 'nan') |
-                (self.df[col].astype(str).str.lower() == 'none') |
-                (self.df[col].astype(str).str.lower() == 'null')
-            )
-            missing_indices = self.df[missing_mask].index.tolist()
-            
-            if len(missing_indices) > 0:
-                missing_percent = (len(missing_indices) / self.total_rows) * 100
-                
-                # Determine severity based on percentage and column importance
-                if missing_percent > 50:
-                    severity = 'critical'
-                elif missing_percent > 25:
-                    severity = 'high'
-                elif missing_percent > 10:
-                    severity = 'medium'
-                else:
-                    severity = 'low'
-                
-                self.add_issue({
-                    'type': 'missing',
-                    'severity': severity,
-                    'column': col,
-                    'title': f'Missing values in {col}',
-                    'description': f'Found {len(missing_indices)} missing/null/empty values in column {col} ({missing_percent:.1f}%)',
-                    'recordCount': len(missing_indices),
-                    'impactScore': round(missing_percent, 1),
-                    'affectedRows': [self.adjust_row_number(idx) for idx in missing_indices],  # All affected rows
-                    'totalAffectedRows': len(missing_indices),
-                    'exampleBadValues': ['NULL', 'empty', ''],
-                    'expectedFormat': 'Non-empty values',
-                    'exactLocations': [{'row': self.adjust_row_number(idx), 'column': col, 'value': 'NULL/Empty'} for idx in missing_indices[:20]]
-                })
-    
+        self._run_per_column(self._missing_values_for_col)
+
+    def _missing_values_for_col(self, col) -> List[Dict]:
+        # Check for: NaN, None, empty string, whitespace-only strings, and string 'nan'
+        # One astype/strip/lower pass plus a single hashmap lookup via isin
+        s = self.df[col]
+        s_norm = self._str_stripped_lower(col)
+        missing_mask = s.isna() | s_norm.isin(('', 'nan', 'none', 'null'))
+        missing_indices = self._mask_to_pos(missing_mask)
+
+        if len(missing_indices) == 0:
+            return []
+
+        missing_percent = (len(missing_indices) / self.total_rows) * 100
+
+        # Determine severity based on percentage and column importance
+        if missing_percent > 50:
+            severity = 'critical'
+        elif missing_percent > 25:
+            severity = 'high'
+        elif missing_percent > 10:
+            severity = 'medium'
+        else:
+            severity = 'low'
+
+        return [{
+            'type': 'missing',
+            'severity': severity,
+            'column': col,
+            'title': f'Missing values in {col}',
+            'description': f'Found {len(missing_indices)} missing/null/empty values in column {col} ({missing_percent:.1f}%)',
+            'recordCount': len(missing_indices),
+            'impactScore': round(missing_percent, 1),
+            'affectedRows': self._affected_rows(missing_indices),
+            'affectedRowsTruncated': len(missing_indices) > MAX_AFFECTED_ROWS,
+            'totalAffectedRows': len(missing_indices),
+            'exampleBadValues': ['NULL', 'empty', ''],
+            'expectedFormat': 'Non-empty values',
+            'exactLocations': [{'row': self.adjust_row_number(int(idx)), 'column': col, 'value': 'NULL/Empty'} for idx in missing_indices[:20]]
+        }]
+
+
     def detect_null_placeholders(self):
         """Detect placeholder values like 'BAD_PHONE', 'INVALID', 'N/A', etc."""
-        placeholder_patterns = [
-            r'BAD_\w+',
-            r'INVALID\w*',
-            r'NULL',
-            r'N/A',
-            r'NA',
-            r'NONE',
-            r'UNKNOWN',
-            r'TBD',
-            r'TODO',
-            r'XXX',
-            r'###',
-            r'---',
-            r'PLACEHOLDER',
-            r'TEMP',
-            r'TEST',
-            r'DUMMY'
-        ]
-        
-        pattern = '|'.join(placeholder_patterns)
-        
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object':  # String columns
-                placeholder_mask = self.df[col].astype(str).str.contains(pattern, case=False, na=False, regex=True)
-                placeholder_indices = self.df[placeholder_mask].index.tolist()
-                
-                if len(placeholder_indices) > 0:
-                    bad_values = self.df.loc[placeholder_indices, col].unique().tolist()[:10]
-                    
-                    self.add_issue({
-                        'type': 'invalid',
-                        'severity': 'high',
-                        'column': col,
-                        'title': f'Invalid placeholder values in {col}',
-                        'description': f'Found {len(placeholder_indices)} placeholder/invalid values like {", ".join(map(str, bad_values[:3]))}',
-                        'recordCount': len(placeholder_indices),
-                        'impactScore': round((len(placeholder_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in placeholder_indices],
-                        'totalAffectedRows': len(placeholder_indices),
-                        'exampleBadValues': [str(v) for v in bad_values[:5]],
-                        'expectedFormat': 'Valid data values (no placeholders)',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in placeholder_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._null_placeholders_for_col)
+
+    def _null_placeholders_for_col(self, col) -> List[Dict]:
+        if not self._is_text_col(col):  # String columns only
+            return []
+
+        s = self.df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # Test the handful of categories, then broadcast to rows via codes
+            cats = s.cat.categories.astype(str)
+            cat_mask = (
+                cats.str.lower().isin(_EXACT_PLACEHOLDERS) |
+                cats.str.upper().str.startswith(_PLACEHOLDER_PREFIXES)
+            )
+            placeholder_mask = self._category_row_mask(s, cat_mask)
+        else:
+            s_str = self._str(col)
+            placeholder_mask = (
+                s_str.str.lower().isin(_EXACT_PLACEHOLDERS) |
+                s_str.str.upper().str.startswith(_PLACEHOLDER_PREFIXES)
+            )
+        placeholder_indices = self._mask_to_pos(placeholder_mask)
+
+        if len(placeholder_indices) == 0:
+            return []
+
+        col_vals = self.df[col].to_numpy()
+        bad_values = pd.unique(col_vals[np.asarray(placeholder_indices, dtype=np.int64)])[:10]
+
+        return [{
+            'type': 'invalid',
+            'severity': 'high',
+            'column': col,
+            'title': f'Invalid placeholder values in {col}',
+            'description': f'Found {len(placeholder_indices)} placeholder/invalid values like {", ".join(map(str, bad_values[:3]))}',
+            'recordCount': len(placeholder_indices),
+            'impactScore': round((len(placeholder_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, placeholder_indices),
+            'exampleBadValues': [str(v) for v in bad_values[:5]],
+            'expectedFormat': 'Valid data values (no placeholders)'
+        }]
+
+
     def detect_duplicates(self):
         """Detect duplicate rows with exact locations"""
         # Full row duplicates
         duplicate_mask = self.df.duplicated(keep=False)
-        duplicate_indices = self.df[duplicate_mask].index.tolist()
+        duplicate_indices = self._mask_to_pos(duplicate_mask)
         
         if len(duplicate_indices) > 0:
-            # Group duplicates
+            # Group duplicates via one uint64 row hash per duplicate row:
+            # a stable argsort over the hashes yields the groups in a single
+            # linear pass, with no tuple keys materialized per row
+            dup_df = self.df[duplicate_mask]
+            dup_index = dup_df.index.to_numpy()
+            hashes = pd.util.hash_pandas_object(dup_df, index=False).to_numpy()
+            order = np.argsort(hashes, kind='stable')
+            sorted_hashes = hashes[order]
+            starts = np.flatnonzero(np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]])
+            hash_groups = np.split(order, starts[1:])
+            hash_groups.sort(key=lambda g: g[0])  # back to first-occurrence order
+
             duplicate_groups = []
-            seen = set()
-            
-            for idx in duplicate_indices:
-                if idx not in seen:
-                    row_data = self.df.iloc[idx].to_dict()
-                    matching = self.df[
-                        (self.df == row_data).all(axis=1)
-                    ].index.tolist()
-                    
-                    if len(matching) > 1:
-                        duplicate_groups.append(matching)
-                        seen.update(matching)
+            for g in hash_groups:
+                rows = dup_df.iloc[g]
+                # keep='first' flags everything after the first row only when
+                # the group's contents are uniform (keep=False would be True
+                # for every row here by construction, hiding collisions)
+                if len(g) > 1 and not rows.duplicated(keep='first').iloc[1:].all():
+                    # 64-bit hash collision (rare): split by exact contents
+                    for pos in rows.groupby(list(rows.columns), dropna=False, sort=False).indices.values():
+                        duplicate_groups.append(dup_index[g[pos]].tolist())
+                else:
+                    duplicate_groups.append(dup_index[g].tolist())
             
             # Adjust row numbers in duplicate groups
             adjusted_groups = [[self.adjust_row_number(idx) for idx in group] for group in duplicate_groups]
@@ -179,7 +410,8 @@ class DataQualityDetector:
                 'description': f'Found {len(duplicate_indices)} duplicate rows in {len(duplicate_groups)} groups',
                 'recordCount': len(duplicate_indices),
                 'impactScore': round((len(duplicate_indices) / self.total_rows) * 100, 1),
-                'affectedRows': [self.adjust_row_number(idx) for idx in duplicate_indices],
+                'affectedRows': self._affected_rows(duplicate_indices),
+                'affectedRowsTruncated': len(duplicate_indices) > MAX_AFFECTED_ROWS,
                 'totalAffectedRows': len(duplicate_indices),
                 'exampleBadValues': [f'Rows {group}' for group in adjusted_groups[:3]],
                 'expectedFormat': 'Unique records',
@@ -192,420 +424,451 @@ class DataQualityDetector:
             })
         
         # Column-specific duplicates (e.g., duplicate IDs)
-        for col in self.df.columns:
-            if 'id' in col.lower() or 'code' in col.lower() or 'sku' in col.lower():
-                col_duplicates = self.df[self.df[col].duplicated(keep=False) & self.df[col].notna()]
-                if len(col_duplicates) > 0:
-                    dup_indices = col_duplicates.index.tolist()
-                    dup_values = col_duplicates[col].unique().tolist()[:5]
-                    
-                    self.add_issue({
-                        'type': 'duplicate',
-                        'severity': 'high',
-                        'column': col,
-                        'title': f'Duplicate values in {col}',
-                        'description': f'Found {len(dup_indices)} duplicate values in {col} (should be unique)',
-                        'recordCount': len(dup_indices),
-                        'impactScore': round((len(dup_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in dup_indices],
-                        'totalAffectedRows': len(dup_indices),
-                        'exampleBadValues': [str(v) for v in dup_values],
-                        'expectedFormat': 'Unique identifier values',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in dup_indices[:20]
-                        ]
-                    })
+        for col in self._id_like_cols:
+            # One factorize+group-indices pass gives both the repeated values
+            # and their positions, replacing the duplicated/notna/unique chain
+            groups = self.df.groupby(col, dropna=True, sort=False, observed=True).indices
+            dup_items = [(v, pos) for v, pos in groups.items() if len(pos) > 1]
+            if dup_items:
+                dup_indices = np.sort(np.concatenate([p for _, p in dup_items]))
+                dup_values = [v for v, _ in dup_items[:5]]
+
+                self.add_issue({
+                    'type': 'duplicate',
+                    'severity': 'high',
+                    'column': col,
+                    'title': f'Duplicate values in {col}',
+                    'description': f'Found {len(dup_indices)} duplicate values in {col} (should be unique)',
+                    'recordCount': len(dup_indices),
+                    'impactScore': round((len(dup_indices) / self.total_rows) * 100, 1),
+                    **self._location_fields(col, dup_indices),
+                    'exampleBadValues': [str(v) for v in dup_values],
+                    'expectedFormat': 'Unique identifier values'
+                })
     
     def detect_invalid_emails(self):
         """Detect invalid email formats with exact locations"""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        for col in self.df.columns:
-            if 'email' in col.lower():
-                invalid_indices = []
-                
-                for idx, value in self.df[col].items():
-                    if pd.notna(value) and value != '':
-                        if not re.match(email_pattern, str(value)):
-                            invalid_indices.append(idx)
-                
-                if len(invalid_indices) > 0:
-                    bad_emails = self.df.loc[invalid_indices, col].head(5).tolist()
-                    
-                    self.add_issue({
-                        'type': 'invalid',
-                        'severity': 'medium',
-                        'column': col,
-                        'title': f'Invalid email format in {col}',
-                        'description': f'Found {len(invalid_indices)} invalid email addresses',
-                        'recordCount': len(invalid_indices),
-                        'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in invalid_indices],
-                        'totalAffectedRows': len(invalid_indices),
-                        'exampleBadValues': [str(v) for v in bad_emails],
-                        'expectedFormat': 'user@domain.com',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in invalid_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._invalid_emails_for_col)
+
+    def _invalid_emails_for_col(self, col) -> List[Dict]:
+        if col not in self._email_cols:
+            return []
+
+        s = self.df[col]
+        invalid_mask = s.notna() & (s != '') & ~self._str(col).str.match(_EMAIL_RE)
+        invalid_indices = self._mask_to_pos(invalid_mask)
+
+        if len(invalid_indices) == 0:
+            return []
+
+        return [{
+            'type': 'invalid',
+            'severity': 'medium',
+            'column': col,
+            'title': f'Invalid email format in {col}',
+            'description': f'Found {len(invalid_indices)} invalid email addresses',
+            'recordCount': len(invalid_indices),
+            'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, invalid_indices),
+            'exampleBadValues': self._example_values(col, invalid_indices),
+            'expectedFormat': 'user@domain.com'
+        }]
+
+
     def detect_invalid_phones(self):
         """Detect invalid phone numbers with exact locations"""
-        for col in self.df.columns:
-            if 'phone' in col.lower():
-                invalid_indices = []
-                
-                for idx, value in self.df[col].items():
-                    if pd.notna(value) and value != '':
-                        # Remove common separators
-                        cleaned = re.sub(r'[-\s()\.]', '', str(value))
-                        # Check if it's a valid phone (10-15 digits, optional +)
-                        if not re.match(r'^\+?\d{10,15}$', cleaned):
-                            invalid_indices.append(idx)
-                
-                if len(invalid_indices) > 0:
-                    bad_phones = self.df.loc[invalid_indices, col].head(5).tolist()
-                    
-                    self.add_issue({
-                        'type': 'invalid',
-                        'severity': 'medium',
-                        'column': col,
-                        'title': f'Invalid phone format in {col}',
-                        'description': f'Found {len(invalid_indices)} invalid phone numbers',
-                        'recordCount': len(invalid_indices),
-                        'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in invalid_indices],
-                        'totalAffectedRows': len(invalid_indices),
-                        'exampleBadValues': [str(v) for v in bad_phones],
-                        'expectedFormat': '+[country code][number] (10-15 digits)',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in invalid_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._invalid_phones_for_col)
+
+    def _invalid_phones_for_col(self, col) -> List[Dict]:
+        if col not in self._phone_cols:
+            return []
+
+        s = self.df[col]
+        # Remove common separators, then check for 10-15 digits (optional +)
+        cleaned = self._str(col).str.replace(_PHONE_SEP_RE, '', regex=True)
+        invalid_mask = s.notna() & (s != '') & ~cleaned.str.match(_PHONE_RE)
+        invalid_indices = self._mask_to_pos(invalid_mask)
+
+        if len(invalid_indices) == 0:
+            return []
+
+        return [{
+            'type': 'invalid',
+            'severity': 'medium',
+            'column': col,
+            'title': f'Invalid phone format in {col}',
+            'description': f'Found {len(invalid_indices)} invalid phone numbers',
+            'recordCount': len(invalid_indices),
+            'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, invalid_indices),
+            'exampleBadValues': self._example_values(col, invalid_indices),
+            'expectedFormat': '+[country code][number] (10-15 digits)'
+        }]
+
+
     def detect_invalid_dates(self):
         """Detect invalid date formats and logical date issues"""
-        for col in self.df.columns:
-            if 'date' in col.lower() or 'time' in col.lower():
-                invalid_indices = []
-                future_indices = []
-                old_indices = []
-                
-                for idx, value in self.df[col].items():
-                    if pd.notna(value) and value != '':
-                        try:
-                            date_val = pd.to_datetime(value)
-                            
-                            # Check if date is in future
-                            if date_val > datetime.now():
-                                future_indices.append(idx)
-                            
-                            # Check if date is very old (before 1900 or more than 50 years ago)
-                            elif date_val.year < 1900 or date_val < datetime.now() - timedelta(days=365*50):
-                                old_indices.append(idx)
-                                
-                        except:
-                            invalid_indices.append(idx)
-                
-                # Invalid format
-                if len(invalid_indices) > 0:
-                    bad_dates = self.df.loc[invalid_indices, col].head(5).tolist()
-                    
-                    self.add_issue({
-                        'type': 'invalid',
-                        'severity': 'medium',
-                        'column': col,
-                        'title': f'Invalid date format in {col}',
-                        'description': f'Found {len(invalid_indices)} unparseable date values',
-                        'recordCount': len(invalid_indices),
-                        'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in invalid_indices],
-                        'totalAffectedRows': len(invalid_indices),
-                        'exampleBadValues': [str(v) for v in bad_dates],
-                        'expectedFormat': 'ISO 8601 (YYYY-MM-DD) or parseable date',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in invalid_indices[:20]
-                        ]
-                    })
-                
-                # Future dates
-                if len(future_indices) > 0:
-                    self.add_issue({
-                        'type': 'inconsistent',
-                        'severity': 'medium',
-                        'column': col,
-                        'title': f'Future dates in {col}',
-                        'description': f'Found {len(future_indices)} dates in the future',
-                        'recordCount': len(future_indices),
-                        'impactScore': round((len(future_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in future_indices[:100]],
-                        'totalAffectedRows': len(future_indices),
-                        'exampleBadValues': [str(self.df.loc[idx, col]) for idx in future_indices[:5]],
-                        'expectedFormat': 'Dates not in the future',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in future_indices[:20]
-                        ]
-                    })
-                
-                # Very old dates
-                if len(old_indices) > 5:  # Only flag if more than 5
-                    self.add_issue({
-                        'type': 'obsolete',
-                        'severity': 'low',
-                        'column': col,
-                        'title': f'Outdated timestamps in {col}',
-                        'description': f'Found {len(old_indices)} very old dates (>50 years or before 1900)',
-                        'recordCount': len(old_indices),
-                        'impactScore': round((len(old_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in old_indices[:100]],
-                        'totalAffectedRows': len(old_indices),
-                        'exampleBadValues': [str(self.df.loc[idx, col]) for idx in old_indices[:5]],
-                        'expectedFormat': 'Recent dates',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in old_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._invalid_dates_for_col)
+
+    def _invalid_dates_for_col(self, col) -> List[Dict]:
+        if col not in self._date_cols:
+            return []
+
+        s = self.df[col]
+        raw_nonnull = s.notna() & (s != '')
+        # One C-level parse of the whole column; unparseable values become NaT
+        parsed = pd.to_datetime(s, errors='coerce', format='mixed')
+        now = pd.Timestamp.now()
+
+        invalid_mask = raw_nonnull & parsed.isna()
+        future_mask = parsed.notna() & (parsed > now)
+        # Very old: before 1900 or more than 50 years ago (future dates excluded)
+        old_mask = parsed.notna() & ~future_mask & (
+            (parsed.dt.year < 1900) | (parsed < now - pd.Timedelta(days=365 * 50))
+        )
+
+        invalid_indices = self._mask_to_pos(invalid_mask)
+        future_indices = self._mask_to_pos(future_mask)
+        old_indices = self._mask_to_pos(old_mask)
+
+        issues = []
+
+        # Invalid format
+        if len(invalid_indices) > 0:
+            issues.append({
+                'type': 'invalid',
+                'severity': 'medium',
+                'column': col,
+                'title': f'Invalid date format in {col}',
+                'description': f'Found {len(invalid_indices)} unparseable date values',
+                'recordCount': len(invalid_indices),
+                'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
+                **self._location_fields(col, invalid_indices),
+                'exampleBadValues': self._example_values(col, invalid_indices),
+                'expectedFormat': 'ISO 8601 (YYYY-MM-DD) or parseable date'
+            })
+
+        # Future dates
+        if len(future_indices) > 0:
+            issues.append({
+                'type': 'inconsistent',
+                'severity': 'medium',
+                'column': col,
+                'title': f'Future dates in {col}',
+                'description': f'Found {len(future_indices)} dates in the future',
+                'recordCount': len(future_indices),
+                'impactScore': round((len(future_indices) / self.total_rows) * 100, 1),
+                **self._location_fields(col, future_indices),
+                'exampleBadValues': self._example_values(col, future_indices),
+                'expectedFormat': 'Dates not in the future'
+            })
+
+        # Very old dates
+        if len(old_indices) > 5:  # Only flag if more than 5
+            issues.append({
+                'type': 'obsolete',
+                'severity': 'low',
+                'column': col,
+                'title': f'Outdated timestamps in {col}',
+                'description': f'Found {len(old_indices)} very old dates (>50 years or before 1900)',
+                'recordCount': len(old_indices),
+                'impactScore': round((len(old_indices) / self.total_rows) * 100, 1),
+                **self._location_fields(col, old_indices),
+                'exampleBadValues': self._example_values(col, old_indices),
+                'expectedFormat': 'Recent dates'
+            })
+
+        return issues
+
+
     def detect_negative_values(self):
         """Detect negative values where they shouldn't be"""
-        negative_keywords = ['price', 'amount', 'quantity', 'count', 'total', 'qty', 'cost', 'balance', 'age']
-        
-        for col in self.df.columns:
-            # Check if column is numeric and has negative keyword
-            if any(keyword in col.lower() for keyword in negative_keywords):
-                try:
-                    numeric_col = pd.to_numeric(self.df[col], errors='coerce')
-                    negative_mask = numeric_col < 0
-                    negative_indices = self.df[negative_mask].index.tolist()
-                    
-                    if len(negative_indices) > 0:
-                        bad_values = numeric_col[negative_indices].head(5).tolist()
-                        
-                        self.add_issue({
-                            'type': 'invalid',
-                            'severity': 'high',
-                            'column': col,
-                            'title': f'Negative values in {col}',
-                            'description': f'Found {len(negative_indices)} negative values where they should be positive/zero',
-                            'recordCount': len(negative_indices),
-                            'impactScore': round((len(negative_indices) / self.total_rows) * 100, 1),
-                            'affectedRows': [self.adjust_row_number(idx) for idx in negative_indices],
-                            'totalAffectedRows': len(negative_indices),
-                            'exampleBadValues': [str(v) for v in bad_values],
-                            'expectedFormat': 'Positive or zero values',
-                            'exactLocations': [
-                                {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                                for idx in negative_indices[:20]
-                            ]
-                        })
-                except:
-                    pass
-    
+        self._run_per_column(self._negative_values_for_col)
+
+    def _negative_values_for_col(self, col) -> List[Dict]:
+        # Check if column is numeric and has negative keyword
+        if col not in self._negative_cols:
+            return []
+
+        try:
+            s = self.df[col]
+            if pd.api.types.is_numeric_dtype(s):
+                numeric_col = s  # already numeric, skip the coercion copy
+            else:
+                numeric_col = self._numeric(col)
+            negative_mask = numeric_col < 0
+            negative_indices = self._mask_to_pos(negative_mask)
+
+            if len(negative_indices) == 0:
+                return []
+
+            bad_values = numeric_col.to_numpy()[np.asarray(negative_indices[:5], dtype=np.int64)]
+
+            return [{
+                'type': 'invalid',
+                'severity': 'high',
+                'column': col,
+                'title': f'Negative values in {col}',
+                'description': f'Found {len(negative_indices)} negative values where they should be positive/zero',
+                'recordCount': len(negative_indices),
+                'impactScore': round((len(negative_indices) / self.total_rows) * 100, 1),
+                **self._location_fields(col, negative_indices),
+                'exampleBadValues': [str(v) for v in bad_values],
+                'expectedFormat': 'Positive or zero values'
+            }]
+        except (TypeError, ValueError):
+            # Column can't be coerced/compared numerically — nothing to flag
+            return []
+
+
     def detect_outliers(self):
         """Detect statistical outliers using IQR method"""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_cols:
-            if self.df[col].notna().sum() > 10:  # Need enough data
-                Q1 = self.df[col].quantile(0.25)
-                Q3 = self.df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 3 * IQR
-                upper_bound = Q3 + 3 * IQR
-                
-                outlier_mask = (self.df[col] < lower_bound) | (self.df[col] > upper_bound)
-                outlier_indices = self.df[outlier_mask].index.tolist()
-                
-                if len(outlier_indices) > 0 and len(outlier_indices) < self.total_rows * 0.1:  # Less than 10%
-                    outlier_values = self.df.loc[outlier_indices, col].head(5).tolist()
-                    
-                    self.add_issue({
-                        'type': 'outlier',
-                        'severity': 'low',
-                        'column': col,
-                        'title': f'Statistical outliers in {col}',
-                        'description': f'Found {len(outlier_indices)} extreme values beyond 3×IQR (Q1={Q1:.2f}, Q3={Q3:.2f})',
-                        'recordCount': len(outlier_indices),
-                        'impactScore': round((len(outlier_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in outlier_indices],
-                        'totalAffectedRows': len(outlier_indices),
-                        'exampleBadValues': [str(v) for v in outlier_values],
-                        'expectedFormat': f'Between {lower_bound:.1f} and {upper_bound:.1f}',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in outlier_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._outliers_for_col)
+
+    def _outliers_for_col(self, col) -> List[Dict]:
+        s = self.df[col]
+        if not pd.api.types.is_numeric_dtype(s) or s.dtype == bool:
+            return []
+        # Magnitude outliers in foreign-key columns are meaningless; the
+        # referential integrity check covers those
+        if col in self._fk_cols:
+            return []
+
+        arr = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid_count = np.count_nonzero(~np.isnan(arr))
+        if valid_count <= 10:  # Need enough data
+            return []
+
+        # Both quartiles from a single partitioning pass on the ndarray
+        Q1, Q3 = np.nanquantile(arr, [0.25, 0.75])
+        IQR = Q3 - Q1
+
+        lower_bound = Q1 - 3 * IQR
+        upper_bound = Q3 + 3 * IQR
+
+        outlier_mask = (arr < lower_bound) | (arr > upper_bound)
+        outlier_indices = np.flatnonzero(outlier_mask).tolist()
+
+        if len(outlier_indices) == 0 or len(outlier_indices) >= self.total_rows * 0.1:  # Less than 10%
+            return []
+
+        return [{
+            'type': 'outlier',
+            'severity': 'low',
+            'column': col,
+            'title': f'Statistical outliers in {col}',
+            'description': f'Found {len(outlier_indices)} extreme values beyond 3×IQR (Q1={Q1:.2f}, Q3={Q3:.2f})',
+            'recordCount': len(outlier_indices),
+            'impactScore': round((len(outlier_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, outlier_indices),
+            'exampleBadValues': self._example_values(col, outlier_indices),
+            'expectedFormat': f'Between {lower_bound:.1f} and {upper_bound:.1f}'
+        }]
+
+
     def detect_whitespace_issues(self):
         """Detect leading/trailing whitespace and excessive spacing"""
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object':
-                whitespace_indices = []
-                
-                for idx, value in self.df[col].items():
-                    if pd.notna(value) and isinstance(value, str):
-                        if value != value.strip() or '  ' in value:
-                            whitespace_indices.append(idx)
-                
-                if len(whitespace_indices) > 5:  # Only flag if significant
-                    self.add_issue({
-                        'type': 'inconsistent',
-                        'severity': 'low',
-                        'column': col,
-                        'title': f'Whitespace issues in {col}',
-                        'description': f'Found {len(whitespace_indices)} values with leading/trailing spaces or excessive spacing',
-                        'recordCount': len(whitespace_indices),
-                        'impactScore': round((len(whitespace_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in whitespace_indices],
-                        'totalAffectedRows': len(whitespace_indices),
-                        'exampleBadValues': [f'"{self.df.loc[idx, col]}"' for idx in whitespace_indices[:5]],
-                        'expectedFormat': 'Trimmed text without extra spaces',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': f'"{self.df.loc[idx, col]}"'} 
-                            for idx in whitespace_indices[:20]
-                        ]
-                    })
-    
+        self._run_per_column(self._whitespace_issues_for_col)
+
+    def _whitespace_issues_for_col(self, col) -> List[Dict]:
+        if not self._is_text_col(col):
+            return []
+
+        s = self.df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            cats = s.cat.categories
+            cat_stripped = cats.str.strip()  # NaN for non-string categories
+            cat_mask = cat_stripped.notna() & (
+                (cats != cat_stripped) | cats.str.contains('  ', regex=False, na=False)
+            )
+            whitespace_mask = self._category_row_mask(s, cat_mask)
+        else:
+            stripped = s.str.strip()  # NaN for non-string values
+            whitespace_mask = stripped.notna() & (
+                (s != stripped) | s.str.contains('  ', regex=False, na=False)
+            )
+        whitespace_indices = self._mask_to_pos(whitespace_mask)
+
+        if len(whitespace_indices) <= 5:  # Only flag if significant
+            return []
+
+        return [{
+            'type': 'inconsistent',
+            'severity': 'low',
+            'column': col,
+            'title': f'Whitespace issues in {col}',
+            'description': f'Found {len(whitespace_indices)} values with leading/trailing spaces or excessive spacing',
+            'recordCount': len(whitespace_indices),
+            'impactScore': round((len(whitespace_indices) / self.total_rows) * 100, 1),
+            'affectedRows': self._affected_rows(whitespace_indices),
+            'affectedRowsTruncated': len(whitespace_indices) > MAX_AFFECTED_ROWS,
+            'totalAffectedRows': len(whitespace_indices),
+            'exampleBadValues': [f'"{v}"' for v in self.df[col].to_numpy()[whitespace_indices[:5]]],
+            'expectedFormat': 'Trimmed text without extra spaces',
+            'exactLocations': [
+                {'row': loc['row'], 'column': col, 'value': f'"{loc["value"]}"'}
+                for loc in self._build_locations(col, whitespace_indices)
+            ]
+        }]
+
+
     def detect_format_inconsistencies(self):
         """Detect inconsistent formats within same column"""
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object' and self.df[col].notna().sum() > 10:
-                # Check date format consistency
-                if 'date' in col.lower():
-                    formats_found = {}
-                    for idx, value in self.df[col].items():
-                        if pd.notna(value):
-                            val_str = str(value)
-                            if re.match(r'\d{4}-\d{2}-\d{2}', val_str):
-                                format_type = 'ISO'
-                            elif re.match(r'\d{2}/\d{2}/\d{4}', val_str):
-                                format_type = 'US'
-                            elif re.match(r'\d{2}-\d{2}-\d{4}', val_str):
-                                format_type = 'EU'
-                            else:
-                                format_type = 'OTHER'
-                            
-                            if format_type not in formats_found:
-                                formats_found[format_type] = []
-                            formats_found[format_type].append(idx)
-                    
-                    if len(formats_found) > 1:
-                        minority_indices = []
-                        for fmt, indices in sorted(formats_found.items(), key=lambda x: len(x[1]))[:-1]:
-                            minority_indices.extend(indices)
-                        
-                        if len(minority_indices) > 0:
-                            self.add_issue({
-                                'type': 'inconsistent',
-                                'severity': 'medium',
-                                'column': col,
-                                'title': f'Inconsistent date formats in {col}',
-                                'description': f'Found {len(formats_found)} different date formats. Formats: {", ".join(formats_found.keys())}',
-                                'recordCount': len(minority_indices),
-                                'impactScore': round((len(minority_indices) / self.total_rows) * 100, 1),
-                                'affectedRows': [self.adjust_row_number(idx) for idx in minority_indices],
-                                'totalAffectedRows': len(minority_indices),
-                                'exampleBadValues': [str(self.df.loc[idx, col]) for idx in minority_indices[:5]],
-                                'expectedFormat': 'Consistent date format (preferably ISO 8601)',
-                                'exactLocations': [
-                                    {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                                    for idx in minority_indices[:20]
-                                ]
-                            })
-    
+        self._run_per_column(self._format_inconsistencies_for_col)
+
+    def _format_inconsistencies_for_col(self, col) -> List[Dict]:
+        if not self._is_text_col(col) or self.df[col].notna().sum() <= 10:
+            return []
+        # Check date format consistency
+        if 'date' not in self._lower_cols[col]:
+            return []
+
+        s = self.df[col]
+        nonnull_pos = np.flatnonzero(s.notna().to_numpy())
+        # Label every value in a single vectorized extract instead of three
+        # re.match calls per cell
+        ext = self._str(col).str.extract(_DATE_FMT_RE)
+        fmt = np.where(ext['ISO'].notna(), 'ISO',
+              np.where(ext['US'].notna(), 'US',
+              np.where(ext['EU'].notna(), 'EU', 'OTHER')))
+
+        formats_found = {}
+        grouped = pd.Series(nonnull_pos).groupby(fmt[nonnull_pos], sort=False).indices
+        for format_type, ix in grouped.items():
+            formats_found[format_type] = nonnull_pos[ix].tolist()
+
+        if len(formats_found) <= 1:
+            return []
+
+        minority_indices = []
+        for fmt, indices in sorted(formats_found.items(), key=lambda x: len(x[1]))[:-1]:
+            minority_indices.extend(indices)
+
+        if len(minority_indices) == 0:
+            return []
+
+        return [{
+            'type': 'inconsistent',
+            'severity': 'medium',
+            'column': col,
+            'title': f'Inconsistent date formats in {col}',
+            'description': f'Found {len(formats_found)} different date formats. Formats: {", ".join(formats_found.keys())}',
+            'recordCount': len(minority_indices),
+            'impactScore': round((len(minority_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, minority_indices),
+            'exampleBadValues': self._example_values(col, minority_indices),
+            'expectedFormat': 'Consistent date format (preferably ISO 8601)'
+        }]
+
+
+    # Common foreign key patterns
+    FK_PATTERNS = {
+        'productid': 'product',
+        'customerid': 'customer',
+        'orderid': 'order',
+        'warehouseid': 'warehouse',
+        'inventoryid': 'inventory',
+        'userid': 'user',
+        'categoryid': 'category'
+    }
+
     def detect_referential_integrity(self):
         """Detect foreign key violations"""
-        # Common foreign key patterns
-        fk_patterns = {
-            'productid': 'product',
-            'customerid': 'customer',
-            'orderid': 'order',
-            'warehouseid': 'warehouse',
-            'inventoryid': 'inventory',
-            'userid': 'user',
-            'categoryid': 'category'
-        }
-        
-        for col in self.df.columns:
-            col_lower = col.lower()
-            for fk_pattern, referenced_table in fk_patterns.items():
-                if fk_pattern in col_lower:
-                    # Check for values that seem out of range or invalid
-                    try:
-                        numeric_col = pd.to_numeric(self.df[col], errors='coerce')
-                        
-                        # Flag very large IDs (>100000) or negative IDs
-                        invalid_mask = (numeric_col > 100000) | (numeric_col < 0)
-                        invalid_indices = self.df[invalid_mask & numeric_col.notna()].index.tolist()
-                        
-                        if len(invalid_indices) > 0:
-                            bad_values = self.df.loc[invalid_indices, col].head(5).tolist()
-                            
-                            self.add_issue({
-                                'type': 'referential_integrity',
-                                'severity': 'high',
-                                'column': col,
-                                'title': f'Potential foreign key violations in {col}',
-                                'description': f'Found {len(invalid_indices)} IDs that appear out of valid range (referencing {referenced_table})',
-                                'recordCount': len(invalid_indices),
-                                'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
-                                'affectedRows': [self.adjust_row_number(idx) for idx in invalid_indices],
-                                'totalAffectedRows': len(invalid_indices),
-                                'exampleBadValues': [str(v) for v in bad_values],
-                                'expectedFormat': f'Valid {referenced_table} IDs (1-100000)',
-                                'exactLocations': [
-                                    {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                                    for idx in invalid_indices[:20]
-                                ]
-                            })
-                    except:
-                        pass
-    
-    def detect_data_type_mismatches(self):
-        """Detect values that don't match expected data type"""
-        for col in self.df.columns:
-            # Detect numbers stored as text in numeric-named columns
-            if any(keyword in col.lower() for keyword in ['id', 'count', 'number', 'qty', 'quantity', 'amount', 'price']):
-                non_numeric_indices = []
-                
-                for idx, value in self.df[col].items():
-                    if pd.notna(value) and value != '':
-                        try:
-                            float(value)
-                        except:
-                            non_numeric_indices.append(idx)
-                
-                if len(non_numeric_indices) > 0:
-                    bad_values = self.df.loc[non_numeric_indices, col].head(5).tolist()
-                    
-                    self.add_issue({
-                        'type': 'invalid',
-                        'severity': 'medium',
+        self._run_per_column(self._referential_integrity_for_col)
+
+    def _referential_integrity_for_col(self, col) -> List[Dict]:
+        issues = []
+        for fk_pattern, referenced_table in self._fk_cols.get(col, []):
+            # Check for values that seem out of range or invalid
+            try:
+                numeric_col = self._numeric(col)
+
+                # Flag very large IDs (>100000) or negative IDs
+                invalid_mask = (numeric_col > 100000) | (numeric_col < 0)
+                invalid_indices = self._mask_to_pos(invalid_mask & numeric_col.notna())
+
+                if len(invalid_indices) > 0:
+                    issues.append({
+                        'type': 'referential_integrity',
+                        'severity': 'high',
                         'column': col,
-                        'title': f'Data type mismatch in {col}',
-                        'description': f'Found {len(non_numeric_indices)} non-numeric values in column that should be numeric',
-                        'recordCount': len(non_numeric_indices),
-                        'impactScore': round((len(non_numeric_indices) / self.total_rows) * 100, 1),
-                        'affectedRows': [self.adjust_row_number(idx) for idx in non_numeric_indices],
-                        'totalAffectedRows': len(non_numeric_indices),
-                        'exampleBadValues': [str(v) for v in bad_values],
-                        'expectedFormat': 'Numeric values',
-                        'exactLocations': [
-                            {'row': self.adjust_row_number(idx), 'column': col, 'value': str(self.df.loc[idx, col])} 
-                            for idx in non_numeric_indices[:20]
-                        ]
+                        'title': f'Potential foreign key violations in {col}',
+                        'description': f'Found {len(invalid_indices)} IDs that appear out of valid range (referencing {referenced_table})',
+                        'recordCount': len(invalid_indices),
+                        'impactScore': round((len(invalid_indices) / self.total_rows) * 100, 1),
+                        **self._location_fields(col, invalid_indices),
+                        'exampleBadValues': self._example_values(col, invalid_indices),
+                        'expectedFormat': f'Valid {referenced_table} IDs (1-100000)'
                     })
-    
+            except (TypeError, ValueError):
+                pass  # non-coercible FK column, skip it
+        return issues
+
+
+    def detect_data_type_mismatches(self):
+        """Detect values that don't match expected data type"""
+        self._run_per_column(self._data_type_mismatches_for_col)
+
+    def _data_type_mismatches_for_col(self, col) -> List[Dict]:
+        # Detect numbers stored as text in numeric-named columns
+        if col not in self._numeric_name_cols:
+            return []
+
+        s = self.df[col]
+        # Only text-like columns can hold numbers stored as text; numeric
+        # (including bool) and datetime columns are skipped outright
+        if pd.api.types.is_numeric_dtype(s) or not self._is_text_col(col):
+            return []
+
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # Parse only the small categories array and broadcast the
+            # failures back to rows through the codes; NaN rows (code -1)
+            # drop out in the broadcast
+            cats = s.cat.categories
+            cat_mask = pd.isna(pd.to_numeric(cats, errors='coerce')) & (cats != '')
+            bad_mask = self._category_row_mask(s, cat_mask)
+        else:
+            # to_numeric coerces the whole column in C; anything non-null
+            # that came back NaN failed to parse
+            parsed = self._numeric(col)
+            bad_mask = parsed.isna() & s.notna() & (s != '')
+        non_numeric_indices = self._mask_to_pos(bad_mask)
+
+        if len(non_numeric_indices) == 0:
+            return []
+
+        return [{
+            'type': 'invalid',
+            'severity': 'medium',
+            'column': col,
+            'title': f'Data type mismatch in {col}',
+            'description': f'Found {len(non_numeric_indices)} non-numeric values in column that should be numeric',
+            'recordCount': len(non_numeric_indices),
+            'impactScore': round((len(non_numeric_indices) / self.total_rows) * 100, 1),
+            **self._location_fields(col, non_numeric_indices),
+            'exampleBadValues': self._example_values(col, non_numeric_indices),
+            'expectedFormat': 'Numeric values'
+        }]
+
+
+    # Which quality dimensions each issue type degrades, and by how much
+    _TYPE_WEIGHTS = {
+        'missing': (('completeness', 0.5),),
+        'invalid': (('validity', 0.3), ('accuracy', 0.2)),
+        'duplicate': (('uniqueness', 0.5),),
+        'inconsistent': (('consistency', 0.3),),
+        'outlier': (('accuracy', 0.1),),
+        'obsolete': (('timeliness', 0.3),),
+        'referential_integrity': (('integrity', 0.4),),
+    }
+
     def calculate_quality_scores(self):
         """Calculate quality dimension scores based on detected issues"""
+        # Streamed issues are gone from memory, so scoring them is impossible;
+        # refuse rather than report perfect 100s for a table full of defects
+        if self.stream:
+            raise RuntimeError('quality scores are unavailable with stream=True: '
+                               'issues are emitted to stdout, not collected')
         # Start with perfect scores
         scores = {
             'accuracy': 100,
@@ -616,42 +879,32 @@ class DataQualityDetector:
             'timeliness': 100,
             'integrity': 100
         }
-        
-        # Deduct points based on issues
-        for issue in self.issues:
-            impact = min(issue['impactScore'], 100)  # Cap at 100
-            
-            if issue['type'] == 'missing':
-                scores['completeness'] -= impact * 0.5
-            elif issue['type'] == 'invalid':
-                scores['validity'] -= impact * 0.3
-                scores['accuracy'] -= impact * 0.2
-            elif issue['type'] == 'duplicate':
-                scores['uniqueness'] -= impact * 0.5
-            elif issue['type'] == 'inconsistent':
-                scores['consistency'] -= impact * 0.3
-            elif issue['type'] == 'outlier':
-                scores['accuracy'] -= impact * 0.1
-            elif issue['type'] == 'obsolete':
-                scores['timeliness'] -= impact * 0.3
-            elif issue['type'] == 'referential_integrity':
-                scores['integrity'] -= impact * 0.4
-        
+
+        # Deduct points based on issues: one vectorized reduction per issue
+        # type instead of an if/elif chain evaluated for every issue
+        types = np.array([issue['type'] for issue in self.issues])
+        impacts = np.minimum(
+            np.fromiter((issue['impactScore'] for issue in self.issues),
+                        np.float64, count=len(self.issues)),
+            100.0)  # Cap at 100
+        for issue_type, weights in self._TYPE_WEIGHTS.items():
+            total = impacts[types == issue_type].sum()
+            if total:
+                for dimension, weight in weights:
+                    scores[dimension] -= total * weight
+
         # Ensure scores don't go below 0
         for key in scores:
             scores[key] = max(0, round(scores[key], 1))
         
-        # Calculate overall score (weighted average)
-        overall = (
-            scores['accuracy'] * 0.20 +
-            scores['completeness'] * 0.20 +
-            scores['consistency'] * 0.15 +
-            scores['uniqueness'] * 0.10 +
-            scores['validity'] * 0.20 +
-            scores['timeliness'] * 0.05 +
-            scores['integrity'] * 0.10
-        )
-        scores['overallScore'] = round(overall, 1)
+        # Calculate overall score (weighted average) as one dot product
+        dims = ('accuracy', 'completeness', 'consistency', 'uniqueness',
+                'validity', 'timeliness', 'integrity')
+        dim_weights = np.array([0.20, 0.20, 0.15, 0.10, 0.20, 0.05, 0.10])
+        overall = np.dot(
+            np.fromiter((scores[d] for d in dims), np.float64, count=len(dims)),
+            dim_weights)
+        scores['overallScore'] = round(float(overall), 1)
         
         return scores
 
@@ -659,14 +912,19 @@ class DataQualityDetector:
 def main():
     """Main entry point"""
     try:
-        # Read input JSON from stdin (avoids command-line length limits)
-        input_json = sys.stdin.read()
-        
+        # Read input JSON from stdin (avoids command-line length limits).
+        # Raw bytes skip the str decode copy; orjson parses them directly
+        # in C when available, stdlib json accepts bytes as well.
+        input_json = sys.stdin.buffer.read()
+
         if not input_json:
             print(json.dumps({'error': 'No data provided'}))
             sys.exit(1)
-        
-        input_data = json.loads(input_json)
+
+        if orjson is not None:
+            input_data = orjson.loads(input_json)
+        else:
+            input_data = json.loads(input_json)
         data = input_data.get('data', [])
         table_name = input_data.get('tableName', 'Unknown')
         
@@ -686,8 +944,15 @@ def main():
             'summary': f'Detected {len(issues)} data quality issues across {detector.total_cols} columns and {detector.total_rows} rows'
         }
         
-        print(json.dumps(result))
-        
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY handles any numpy scalars in the payload
+            # without per-value int()/float() coercion
+            sys.stdout.buffer.write(
+                orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+            sys.stdout.buffer.write(b'\n')
+        else:
+            print(json.dumps(result))
+
     except Exception as e:
         print(json.dumps({'error': str(e)}), file=sys.stderr)
         sys.exit(1)